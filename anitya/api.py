@@ -188,7 +188,7 @@ def api_packages_wiki_list():
       * 3proxy None https://www.3proxy.ru/download/
     """
 
-    project_objs = models.Project.all(Session)
+    project_objs = models.Project.all(Session, detailed=True)
 
     projects = []
     for project in project_objs:
@@ -157,7 +157,7 @@ class PackagesResource(MethodView):
         distro = args.pop("distribution", "")
         name = args.pop("name", "")
         if distro:
-            q = q.filter(func.lower(models.Packages.distro_name) == func.lower(distro))
+            q = q.filter(func.lower(models.Packages.distro_name) == distro.lower())
         if name:
             q = q.filter(func.lower(models.Packages.package_name) == func.lower(name))
         page = q.paginate(order_by=models.Packages.package_name, **args)
@@ -258,7 +258,7 @@ class PackagesResource(MethodView):
 
         try:
             distro = models.Distro.query.filter(
-                func.lower(models.Distro.name) == func.lower(args["distribution"])
+                func.lower(models.Distro.name) == args["distribution"].lower()
             ).one()
         except NoResultFound:
             return (
@@ -37,6 +37,10 @@ DEFAULTS = dict(
     SECRET_KEY="changeme please",
     # URL to the database
     DB_URL="sqlite:////var/tmp/anitya-dev.sqlite",
+    # Number of connections kept open in the database connection pool
+    DB_POOL_SIZE=25,
+    # Number of connections allowed on top of the pool size under load
+    DB_MAX_OVERFLOW=10,
     # List of admins based on their openid
     ANITYA_WEB_ADMINS=[],
     ADMIN_EMAIL="admin@fedoraproject.org",
@@ -17,10 +17,11 @@
 import logging
 
 from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from anitya.lib import plugins
 
-from .models import Project
+from .models import LOOKUP_CACHE_KEY, Project
 
 _log = logging.getLogger(__name__)
 
@@ -36,13 +37,9 @@ def _set_ecosystem(project, backend, homepage):
         backend (str): value of backend
         homepage (str): value of homepage
     """
-    ecosystems = [
-        e
-        for e in plugins.ECOSYSTEM_PLUGINS.get_plugins()
-        if e.default_backend == backend
-    ]
-    if ecosystems:
-        project.ecosystem_name = ecosystems[0].name
+    ecosystem = plugins.ECOSYSTEM_PLUGINS.get_plugin_by_default_backend(backend)
+    if ecosystem:
+        project.ecosystem_name = ecosystem.name
     else:
         project.ecosystem_name = homepage
     _log.info(
@@ -50,6 +47,26 @@ def _set_ecosystem(project, backend, homepage):
     )
 
 
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_transaction_end")
+def clear_lookup_cache(session, *args):
+    """
+    An SQLAlchemy event listener that forgets the instances looked up by name.
+
+    Once the session is flushed or its transaction is committed or rolled back
+    the remembered primary keys may no longer match the database, as other
+    transactions may have changed it, so they are dropped.
+
+    Args:
+        session (sqlalchemy.orm.session.Session): The session being flushed or
+                whose transaction ended.
+        args (tuple): The remaining arguments of the event.
+    """
+    cache = session.info.get(LOOKUP_CACHE_KEY)
+    if cache:
+        cache.clear()
+
+
 @event.listens_for(Project.backend, "set", raw=True)
 def set_ecosystem_backend(target, value, old, initiator):
     """
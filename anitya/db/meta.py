@@ -28,7 +28,7 @@ from __future__ import unicode_literals
 
 import collections
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, func
 from sqlalchemy.ext import declarative
 from sqlalchemy.orm import query as sa_query
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -49,6 +49,18 @@ def initialize(config):
     This creates a database engine from the provided configuration and
     configures the scoped session to use the engine.
 
+    For databases other than SQLite the engine uses a connection pool sized by
+    ``DB_POOL_SIZE`` and ``DB_MAX_OVERFLOW``. Pooled connections are checked
+    with a ping before being handed out and recycled after an hour, so
+    connections dropped by the server don't end up in a request. PostgreSQL
+    pools are used in LIFO order to keep the most recently used connections warm.
+    With psycopg2, executemany ``UPDATE`` and ``DELETE`` statements are sent in
+    batches, in addition to the multi-row ``INSERT`` SQLAlchemy does by default.
+
+    The size of SQLAlchemy's compiled statement cache can be set with
+    ``DB_QUERY_CACHE_SIZE``. It defaults to 1200 statements, or 2000 on
+    PostgreSQL, and is left at the SQLAlchemy default for SQLite.
+
     Args:
         config (dict): A dictionary that contains the configuration necessary
             to initialize the database.
@@ -58,7 +70,25 @@ def initialize(config):
     """
     #: The SQLAlchemy database engine. This is constructed using the value of
     #: ``DB_URL`` in :mod:`anitya.config``.
-    engine = create_engine(config["DB_URL"], echo=config.get("SQL_DEBUG", False))
+    engine_args = {}
+    if not config["DB_URL"].startswith("sqlite:"):
+        engine_args.update(
+            pool_size=config.get("DB_POOL_SIZE", 25),
+            max_overflow=config.get("DB_MAX_OVERFLOW", 10),
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            query_cache_size=config.get("DB_QUERY_CACHE_SIZE", 1200),
+        )
+    if config["DB_URL"].startswith("postgresql"):
+        engine_args.update(
+            pool_use_lifo=True,
+            query_cache_size=config.get("DB_QUERY_CACHE_SIZE", 2000),
+        )
+    if config["DB_URL"].startswith(("postgresql:", "postgresql+psycopg2:")):
+        engine_args.update(executemany_mode="values_plus_batch")
+    engine = create_engine(
+        config["DB_URL"], echo=config.get("SQL_DEBUG", False), **engine_args
+    )
     # Source: https://docs.sqlalchemy.org/en/latest/dialects/sqlite.html#foreign-key-support
     if config["DB_URL"].startswith("sqlite:"):
         event.listen(
@@ -138,8 +168,21 @@ class BaseQuery(sa_query.Query):
             order_by = (order_by,)
 
         result = self.order_by(*order_by)
-        total_items = result.count()
-        items = result.limit(items_per_page).offset(items_per_page * (page - 1)).all()
+        # Fetch the total number of items with the page itself using a window
+        # function, so only one query is sent to the database.
+        rows = (
+            result.add_columns(func.count().over().label("total_items"))
+            .limit(items_per_page)
+            .offset(items_per_page * (page - 1))
+            .all()
+        )
+        if rows:
+            items = [row[0] for row in rows]
+            total_items = rows[0].total_items
+        else:
+            # The page is past the last item, so the window had nothing to count
+            items = []
+            total_items = result.count()
         return Page(
             items=items,
             page=page,
@@ -147,6 +190,38 @@ class BaseQuery(sa_query.Query):
             items_per_page=items_per_page,
         )
 
+    def paginate_keyset(self, order_by, after=None, items_per_page=None):
+        """
+        Retrieve the items following a given value of the ordering column.
+
+        Unlike :meth:`paginate`, this doesn't use an offset, so the database
+        doesn't need to scan all the preceding rows to get to deep pages.
+
+        Args:
+            order_by (sa.Column): The column to order the items by. The values of
+                                  this column should be unique.
+            after (object): The value of ``order_by`` for the last item of the
+                            previous page. If ``None``, the first page is returned.
+            items_per_page (int): The number of items per page. This defaults
+                                  to 25.
+
+        Returns:
+            list: The items of the page.
+
+        Raises:
+            ValueError: If the items_per_page value is less than 1.
+        """
+        if items_per_page is None:
+            items_per_page = 25
+
+        if items_per_page < 1:
+            raise ValueError("items_per_page must be 1 or greater.")
+
+        result = self
+        if after is not None:
+            result = result.filter(order_by > after)
+        return result.order_by(order_by).limit(items_per_page).all()
+
 
 class _AnityaBase(object):
     """
@@ -0,0 +1,46 @@
+"""Add lower case name indexes
+
+Revision ID: 4d6a3e2f9b1c
+Revises: 2d1aa7ff82a5
+Create Date: 2026-10-15 10:12:41.318206
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4d6a3e2f9b1c"
+down_revision = "2d1aa7ff82a5"
+
+
+def upgrade():
+    """
+    Add indexes on the lower case names of distributions, packages and projects,
+    which are used by the case-insensitive lookups.
+    """
+    op.create_index(
+        "ix_distros_name_lower", "distros", [sa.text("lower(name)")], unique=False
+    )
+    op.create_index(
+        "ix_packages_distro_name_lower",
+        "packages",
+        [sa.text("lower(distro_name)")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_packages_project_distro_lower_name",
+        "packages",
+        ["project_id", sa.text("lower(distro_name)"), "package_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_name_lower", "projects", [sa.text("lower(name)")], unique=False
+    )
+
+
+def downgrade():
+    """Drop the lower case name indexes."""
+    op.drop_index("ix_projects_name_lower", table_name="projects")
+    op.drop_index("ix_packages_project_distro_lower_name", table_name="packages")
+    op.drop_index("ix_packages_distro_name_lower", table_name="packages")
+    op.drop_index("ix_distros_name_lower", table_name="distros")
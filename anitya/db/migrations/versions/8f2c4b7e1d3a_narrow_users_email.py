@@ -0,0 +1,37 @@
+"""Narrow users email
+
+Revision ID: 8f2c4b7e1d3a
+Revises: 4d6a3e2f9b1c
+Create Date: 2026-10-15 16:20:07.512934
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f2c4b7e1d3a"
+down_revision = "4d6a3e2f9b1c"
+
+
+def upgrade():
+    """
+    Limit the email to the 254 characters a valid address can have.
+    """
+    op.alter_column(
+        "users",
+        "email",
+        existing_type=sa.String(256),
+        type_=sa.String(254),
+        existing_nullable=False,
+    )
+
+
+def downgrade():
+    """Restore the email to 256 characters."""
+    op.alter_column(
+        "users",
+        "email",
+        existing_type=sa.String(254),
+        type_=sa.String(256),
+        existing_nullable=False,
+    )
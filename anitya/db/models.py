@@ -25,14 +25,14 @@ import string
 import time
 import uuid
 from secrets import choice as random_choice
+from secrets import randbits
 
 import arrow
-import six
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import validates
 from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy.types import CHAR, TypeDecorator
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.types import TypeDecorator
 
 from anitya.config import config as anitya_config
 from anitya.lib.plugins import BACKEND_PLUGINS, ECOSYSTEM_PLUGINS, VERSION_PLUGINS
@@ -44,23 +44,216 @@ _log = logging.getLogger(__name__)
 
 DEFAULT_PAGE_LIMIT = 50
 
+#: The number of rows fetched at once when iterating over large results.
+YIELD_PER = 100
 
-def _paginate_query(query, page):
-    """Paginate a given query to returned the specified page (if any)."""
-    if page:
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+#: The key in ``Session.info`` holding the primary keys remembered by
+#: :func:`_cached_lookup`.
+LOOKUP_CACHE_KEY = "anitya.lookup_cache"
+
+
+def _paginate_query(
+    query, page, per_page=DEFAULT_PAGE_LIMIT, order_col=None, after=None
+):
+    """Paginate a given query to returned the specified page (if any).
+
+    The query can be either an ORM query or a statement built with
+    :func:`sqlalchemy.lambda_stmt`. Only ``page`` applies to the latter;
+    ``order_col`` and ``after`` are for ORM queries.
+
+    When ``after`` is provided, the rows following that value of ``order_col``
+    are returned instead of a page. This keyset pagination doesn't need the
+    database to walk through all the preceding rows like ``OFFSET`` does, but
+    it requires ``order_col`` to be unique.
+
+    Args:
+        query (sqlalchemy.orm.Query): The query to paginate.
+        page (int): The page to return, starting at 1. Nothing is paginated if
+            it is ``None``.
+        per_page (int): The number of rows on a page.
+        order_col (sqlalchemy.Column): The column to order the rows by.
+        after (object): The value of ``order_col`` of the last row already
+            returned.
+
+    Returns:
+        sqlalchemy.orm.Query: The paginated query.
+
+    Raises:
+        ValueError: If ``after`` is provided without ``order_col``.
+    """
+    if after is not None and order_col is None:
+        raise ValueError("after requires an order_col to paginate on.")
+
+    if order_col is not None:
+        query = query.order_by(order_col)
+
+    if after is not None:
+        return query.filter(order_col > after).limit(per_page)
+
+    if page and not isinstance(page, int):
         try:
             page = int(page)
         except ValueError:
             page = None
 
     if page:
-        limit = DEFAULT_PAGE_LIMIT
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        offset = (page - 1) * per_page
+        if isinstance(query, StatementLambdaElement):
+            query += lambda s: s.offset(offset).limit(per_page)
+        else:
+            query = query.offset(offset).limit(per_page)
 
     return query
 
 
+def _compile_pattern(pattern, contains=False):
+    """
+    Turn a search pattern provided by a user into an SQL comparison.
+
+    ``*`` (or ``%``) matches any string. Without a wildcard, the pattern has to
+    match the whole value, or only be a part of it if ``contains`` is set.
+    ``_`` only matches itself.
+
+    Args:
+        pattern (str): The pattern provided by the user.
+        contains (bool): Whether to match values containing the pattern.
+
+    Returns:
+        tuple: The operator, either ``"ilike"`` or ``"=="``, and the value to
+            compare with. The ``ilike`` values use ``\\`` as escape character.
+    """
+    value = pattern.replace("_", r"\_")
+    if "*" in value:
+        return "ilike", value.replace("*", "%")
+    if contains:
+        return "ilike", f"%{value}%"
+    if "%" in value:
+        return "ilike", value
+    return "==", pattern
+
+
+def _to_epoch(value):
+    """
+    Convert a naive UTC datetime to a POSIX timestamp.
+
+    This is equivalent to ``time.mktime(value.timetuple())`` on a host using
+    UTC, but doesn't depend on the host's time zone.
+
+    Args:
+        value (datetime.datetime): The naive UTC datetime to convert.
+
+    Returns:
+        float: The number of whole seconds since the epoch.
+    """
+    return (value.replace(microsecond=0) - _EPOCH).total_seconds()
+
+
+def _cached_lookup(session, model, key, query):
+    """
+    Look up a single instance, remembering its primary key for the session.
+
+    Further lookups with the same key are answered from the session's identity
+    map without emitting a ``SELECT``. Only primary keys are remembered, so no
+    instance ever leaks into another session. The cache is cleared whenever the
+    session is flushed or its transaction ends, see :mod:`anitya.db.events`.
+
+    Args:
+        session (sqlalchemy.orm.session.Session): The database session.
+        model (Base): The mapped class to look up.
+        key (tuple): The normalized lookup arguments.
+        query (callable): Called without arguments to query the instance when
+            it isn't cached.
+
+    Returns:
+        Base: The instance or ``None`` if it doesn't exist.
+    """
+    cache = session.info.setdefault(LOOKUP_CACHE_KEY, {})
+    identity = cache.get((model, key))
+    if identity is not None:
+        instance = session.get(model, identity)
+        # Pending changes are only visible once the query flushes them
+        if (
+            instance is not None
+            and not sa.inspect(instance).modified
+            and instance not in session.deleted
+        ):
+            return instance
+
+    instance = query()
+    if instance is not None:
+        cache[(model, key)] = sa.inspect(instance).identity
+    return instance
+
+
+#: The last list of administrators read from the configuration, and the set
+#: built from it by :func:`_admin_ids`.
+_admin_ids_cache = (None, frozenset())
+
+
+def _admin_ids():
+    """
+    Return the IDs of the users configured as administrators.
+
+    The set is only rebuilt when ``ANITYA_WEB_ADMINS`` is replaced in the
+    configuration, so checking whether a user is an administrator is a single
+    lookup.
+
+    Returns:
+        frozenset: The IDs of the administrators, as strings.
+    """
+    global _admin_ids_cache  # pylint: disable=W0603
+    admins = anitya_config.get("ANITYA_WEB_ADMINS", [])
+    if _admin_ids_cache[0] is not admins:
+        _admin_ids_cache = (admins, frozenset(admins))
+    return _admin_ids_cache[1]
+
+
+def _count_query(session, query, distinct_column=None):
+    """Count the rows selected by an ORM query.
+
+    Unlike :meth:`sqlalchemy.orm.Query.count`, the query isn't wrapped in a
+    subquery selecting all the columns of the entity; its criteria are used
+    directly in a ``SELECT count(*)``.
+
+    Args:
+        session (sqlalchemy.orm.session.Session): The database session.
+        query (sqlalchemy.orm.Query): The query to count the rows of. It should
+            be neither distinct nor paginated.
+        distinct_column (sqlalchemy.Column): If provided, count the distinct
+            values of this column instead of the rows.
+
+    Returns:
+        int: The number of rows.
+    """
+    if distinct_column is not None:
+        count = sa.func.count(sa.distinct(distinct_column))
+    else:
+        count = sa.func.count()
+    stmt = query.statement.with_only_columns(
+        count, maintain_column_froms=True
+    ).order_by(None)
+    return session.execute(stmt).scalar()
+
+
+def _count_stmt(stmt):
+    """Turn a statement built with :func:`sqlalchemy.lambda_stmt` into a COUNT.
+
+    Args:
+        stmt (sqlalchemy.sql.lambdas.StatementLambdaElement): The select statement.
+
+    Returns:
+        sqlalchemy.sql.lambdas.StatementLambdaElement: A statement returning the
+            number of rows the original statement selects.
+    """
+    return stmt + (
+        lambda s: s.with_only_columns(
+            sa.func.count(), maintain_column_froms=True
+        ).order_by(None)
+    )
+
+
 class Distro(Base):
     """Class Distro"""
 
@@ -68,6 +261,8 @@ class Distro(Base):
 
     name = sa.Column(sa.String(200), primary_key=True)
 
+    __table_args__ = (sa.Index("ix_distros_name_lower", sa.func.lower(name)),)
+
     def __init__(self, name):
         """Constructor."""
         self.name = name
@@ -78,46 +273,55 @@ class Distro(Base):
     @classmethod
     def by_name(cls, session, name):
         """Get Distro name"""
-        query = session.query(cls).filter(
-            sa.func.lower(cls.name) == sa.func.lower(name)
-        )
 
-        return query.first()
+        def query():
+            return (
+                session.query(cls)
+                .filter(sa.func.lower(cls.name) == name.lower())
+                .first()
+            )
+
+        return _cached_lookup(session, cls, (name.lower(),), query)
 
     get = by_name
 
     @classmethod
-    def all(cls, session, page=None, count=False):
-        """Distro all"""
-        query = session.query(cls).order_by(cls.name)
+    def all(cls, session, page=None, count=False, after=None):
+        """Distro all
 
-        query = _paginate_query(query, page)
+        If ``after`` is provided, the distributions following that name are
+        returned instead of the given page.
+        """
+        query = session.query(cls)
 
         if count:
-            return query.count()
-        else:
-            return query.all()
+            return _count_query(session, query)
+
+        query = _paginate_query(query, page, order_col=cls.name, after=after)
+
+        return query.all()
 
     @classmethod
-    def search(cls, session, pattern, page=None, count=False):
-        """Search the distribuutions by their name"""
+    def search(cls, session, pattern, page=None, count=False, after=None):
+        """Search the distribuutions by their name
+
+        If ``after`` is provided, the distributions following that name are
+        returned instead of the given page.
+        """
 
         if "*" in pattern:
             pattern = pattern.replace("*", "%")
 
-        query = (
-            session.query(cls)
-            .filter(sa.or_(sa.func.lower(cls.name).like(sa.func.lower(pattern))))
-            .order_by(cls.name)
-            .distinct()
+        query = session.query(cls).filter(
+            sa.or_(sa.func.lower(cls.name).like(sa.func.lower(pattern)))
         )
 
-        query = _paginate_query(query, page)
-
         if count:
-            return query.count()
-        else:
-            return query.all()
+            return _count_query(session, query)
+
+        query = _paginate_query(query, page, order_col=cls.name, after=after)
+
+        return query.all()
 
     @classmethod
     def get_or_create(cls, session, name):
@@ -146,12 +350,19 @@ class Packages(Base):
 
     package_name = sa.Column(sa.String(200))
 
-    __table_args__ = (sa.UniqueConstraint("distro_name", "package_name"),)
-
-    project = sa.orm.relationship(
-        "Project", backref=sa.orm.backref("package", cascade="all, delete-orphan")
+    __table_args__ = (
+        sa.UniqueConstraint("distro_name", "package_name"),
+        sa.Index("ix_packages_distro_name_lower", sa.func.lower(distro_name)),
+        sa.Index(
+            "ix_packages_project_distro_lower_name",
+            project_id,
+            sa.func.lower(distro_name),
+            package_name,
+        ),
     )
 
+    project = sa.orm.relationship("Project", back_populates="packages")
+
     distro = sa.orm.relationship(
         "Distro", backref=sa.orm.backref("package", cascade="all, delete-orphan")
     )
@@ -170,13 +381,19 @@ class Packages(Base):
     @classmethod
     def get(cls, session, project_id, distro_name, package_name):
         """Get Packages"""
-        query = (
-            session.query(cls)
-            .filter(cls.project_id == project_id)
-            .filter(sa.func.lower(cls.distro_name) == sa.func.lower(distro_name))
-            .filter(cls.package_name == package_name)
+
+        def query():
+            return (
+                session.query(cls)
+                .filter(cls.project_id == project_id)
+                .filter(sa.func.lower(cls.distro_name) == distro_name.lower())
+                .filter(cls.package_name == package_name)
+                .first()
+            )
+
+        return _cached_lookup(
+            session, cls, (project_id, distro_name.lower(), package_name), query
         )
-        return query.first()
 
     @classmethod
     def by_package_name_distro(cls, session, package_name, distro_name):
@@ -184,7 +401,7 @@ class Packages(Base):
         query = (
             session.query(cls)
             .filter(cls.package_name == package_name)
-            .filter(sa.func.lower(cls.distro_name) == sa.func.lower(distro_name))
+            .filter(sa.func.lower(cls.distro_name) == distro_name.lower())
         )
         return query.first()
 
@@ -240,6 +457,9 @@ class Project(Base):
 
     __tablename__ = "projects"
 
+    #: The attributes copied as-is in the output of :meth:`__json__`.
+    _JSON_FIELDS = ("id", "name", "homepage", "regex", "backend", "version_url")
+
     id = sa.Column(sa.Integer, primary_key=True)
     name = sa.Column(sa.String(200), nullable=False, index=True)
     homepage = sa.Column(sa.String(200), nullable=False)
@@ -276,19 +496,26 @@ class Project(Base):
     )
     created_on = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
 
-    packages = sa.orm.relationship("Packages", cascade="all, delete-orphan")
+    packages = sa.orm.relationship(
+        "Packages",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="select",
+    )
+    package = sa.orm.synonym("packages")
 
     __table_args__ = (
         sa.UniqueConstraint("name", "homepage"),
         sa.UniqueConstraint(
             "name", "ecosystem_name", name="UNIQ_PROJECT_NAME_PER_ECOSYSTEM"
         ),
+        sa.Index("ix_projects_name_lower", sa.func.lower(name)),
     )
 
     @validates("backend")
     def validate_backend(self, key, value):
         """Validate backend"""
-        if value not in BACKEND_PLUGINS.get_plugin_names():
+        if not BACKEND_PLUGINS.has_plugin(value):
             raise ValueError(f"Backend '{value}' is not supported.")
         return value
 
@@ -411,6 +638,9 @@ class Project(Base):
         Returns:
            :obj:`list` of :obj:`anitya.lib.versions.Base`: List of version objects
         """
+        if not self.versions_obj:
+            return []
+
         version_class = self.get_version_class()
         versions = [
             version_class(
@@ -423,8 +653,8 @@ class Project(Base):
             )
             for v_obj in self.versions_obj
         ]
-        sorted_versions = list(reversed(sorted(versions)))
-        return sorted_versions
+        # Reverse the ascending order, so equal versions keep their historical order
+        return list(reversed(sorted(versions, key=version_class.sort_key)))
 
     @property
     def latest_version_object(self):
@@ -470,24 +700,16 @@ class Project(Base):
         return f"<Project({self.name}, {self.homepage})>"
 
     def __json__(self, detailed=False):
-        output = dict(
-            id=self.id,
-            name=self.name,
-            homepage=self.homepage,
-            regex=self.regex,
-            backend=self.backend,
-            version_url=self.version_url,
-            version=self.latest_version,
-            versions=self.versions,
-            stable_versions=[str(v) for v in self.stable_versions],
-            created_on=(
-                time.mktime(self.created_on.timetuple()) if self.created_on else None
-            ),
-            updated_on=(
-                time.mktime(self.updated_on.timetuple()) if self.updated_on else None
-            ),
-            ecosystem=self.ecosystem_name,
-        )
+        output = {field: getattr(self, field) for field in self._JSON_FIELDS}
+        output["version"] = self.latest_version
+        sorted_versions = self.get_sorted_version_objects()
+        output["versions"] = [str(v) for v in sorted_versions]
+        output["stable_versions"] = [
+            str(v) for v in sorted_versions if not v.prerelease()
+        ]
+        output["created_on"] = _to_epoch(self.created_on) if self.created_on else None
+        output["updated_on"] = _to_epoch(self.updated_on) if self.updated_on else None
+        output["ecosystem"] = self.ecosystem_name
         if detailed:
             output["packages"] = [pkg.__json__() for pkg in self.packages]
 
@@ -520,6 +742,28 @@ class Project(Base):
         """By homepage"""
         return session.query(cls).filter_by(homepage=homepage).all()
 
+    @classmethod
+    def by_homepage_iter(cls, session, homepage):
+        """
+        Iterate over the projects with the given homepage.
+
+        Unlike :meth:`by_homepage`, the projects are fetched in batches of
+        :data:`YIELD_PER` rows, so they aren't all loaded in memory at once.
+
+        Args:
+            session (sqlalchemy.orm.session.Session): The database session.
+            homepage (str): The homepage of the projects.
+
+        Returns:
+            sqlalchemy.orm.Query: The query yielding the projects.
+        """
+        return (
+            session.query(cls)
+            .filter_by(homepage=homepage)
+            .options(*_project_load_options())
+            .yield_per(YIELD_PER)
+        )
+
     @classmethod
     def by_name_and_homepage(cls, session, name, homepage):
         """By  name and homepage"""
@@ -539,37 +783,43 @@ class Project(Base):
             return None
 
     @classmethod
-    def all(cls, session, page=None, count=False):
+    def all(cls, session, page=None, count=False, detailed=False):
         """all"""
-        query = session.query(Project).order_by(sa.func.lower(Project.name))
-
-        query = _paginate_query(query, page)
+        query = session.query(Project)
 
         if count:
-            return query.count()
-        else:
-            return query.all()
+            return _count_query(session, query)
+
+        query = _paginate_query(query, page, order_col=sa.func.lower(Project.name))
+
+        return query.options(*_project_load_options(detailed)).all()
 
     @classmethod
-    def by_distro(cls, session, distro, page=None, count=False):
+    def by_distro(cls, session, distro, page=None, count=False, detailed=False):
         """By distro"""
-        query = (
-            session.query(Project)
-            .filter(Project.id == Packages.project_id)
-            .filter(sa.func.lower(Packages.distro_name) == sa.func.lower(distro))
-            .order_by(sa.func.lower(Project.name))
+        # Semi-join, so each project is returned once and only the packages
+        # index on the project id and distribution name is looked up
+        query = session.query(Project).filter(
+            Project.packages.any(sa.func.lower(Packages.distro_name) == distro.lower())
         )
 
-        query = _paginate_query(query, page)
-
         if count:
-            return query.count()
-        else:
-            return query.all()
+            return _count_query(session, query)
+
+        query = _paginate_query(query, page, order_col=sa.func.lower(Project.name))
+
+        return query.options(*_project_load_options(detailed)).all()
 
     @classmethod
     def updated(
-        cls, session, status="updated", name=None, log=None, page=None, count=False
+        cls,
+        session,
+        status="updated",
+        name=None,
+        log=None,
+        page=None,
+        count=False,
+        detailed=False,
     ):
         """Method used to retrieve projects according to their logs and
         how they performed at the last cron job.
@@ -579,98 +829,112 @@ class Project(Base):
         :kwarg name: if present, will return the entries having the matching
             name
         :kwarg log: if present, will return the entries having the matching
-            log
+            log. ``*`` matches any string in the name and log patterns, while
+            ``_`` only matches itself
         :kwarg page: The page number of returned, pages contain 50 entries
         :kwarg count: A boolean used to return either the list of entries
             matching the criterias or just the COUNT of entries
+        :kwarg detailed: A boolean used to also load the packages of the
+            returned projects
 
         """
 
-        query = session.query(Project)
+        # The statement is built from lambdas, so SQLAlchemy can cache each
+        # combination of filters and only bind the name and log patterns.
+        stmt = sa.lambda_stmt(lambda: sa.select(Project))
 
         if status == "updated":
-            query = query.filter(
+            stmt += lambda s: s.where(
                 Project.check_successful.isnot(None), Project.check_successful.is_(True)
             ).order_by(Project.last_check.desc())
         elif status == "failed":
-            query = query.filter(
+            stmt += lambda s: s.where(
                 Project.check_successful.isnot(None),
                 Project.check_successful.is_(False),
                 Project.error_counter > 0,
             ).order_by(Project.error_counter.desc())
 
         elif status == "never_updated":
-            query = query.filter(Project.latest_version.is_(None)).order_by(
+            stmt += lambda s: s.where(Project.latest_version.is_(None)).order_by(
                 Project.created_on
             )
         elif status == "archived":
-            query = query.filter(
+            stmt += lambda s: s.where(
                 Project.archived.isnot(None), Project.archived.is_(True)
             )
-        query.order_by(sa.func.lower(Project.name))
 
         if name:
-            if "*" in name:
-                name = name.replace("*", "%")
-            else:
-                name = "%" + name + "%"
-
-            query = query.filter(Project.name.ilike(name))
+            _, name = _compile_pattern(name, contains=True)
+            stmt += lambda s: s.where(Project.name.ilike(name, escape="\\"))
 
         if log:
-            if "*" in log:
-                log = log.replace("*", "%")
-            else:
-                log = "%" + log + "%"
+            _, log = _compile_pattern(log, contains=True)
+            stmt += lambda s: s.where(Project.logs.ilike(log, escape="\\"))
 
-            query = query.filter(Project.logs.ilike(log))
+        if count:
+            return session.execute(_count_stmt(stmt)).scalar()
 
-        query = _paginate_query(query, page)
+        stmt = _paginate_query(stmt, page)
+        stmt += lambda s: s.options(sa.orm.selectinload(Project.versions_obj))
+        if detailed:
+            stmt += lambda s: s.options(sa.orm.selectinload(Project.packages))
 
-        if count:
-            return query.count()
-        else:
-            return query.all()
+        return session.execute(stmt).scalars().all()
 
     @classmethod
-    def search(cls, session, pattern, distro=None, page=None, count=False):
+    def search(
+        cls, session, pattern, distro=None, page=None, count=False, detailed=False
+    ):
         """Search the projects by their name or package name"""
 
-        query1 = session.query(cls)
+        # A single scan over projects and their packages, a project is returned
+        # if either its name or the name of one of its packages matches
+        query = session.query(cls).outerjoin(
+            Packages, Project.id == Packages.project_id
+        )
 
         if pattern:
-            pattern = pattern.replace("_", r"\_")
-            if "*" in pattern:
-                pattern = pattern.replace("*", "%")
-            if "%" in pattern:
-                query1 = query1.filter(Project.name.ilike(pattern))
+            operator, value = _compile_pattern(pattern)
+            if operator == "ilike":
+                query = query.filter(
+                    sa.or_(
+                        Project.name.ilike(value, escape="\\"),
+                        Packages.package_name.ilike(value, escape="\\"),
+                    )
+                )
             else:
-                query1 = query1.filter(Project.name == pattern)
+                query = query.filter(
+                    sa.or_(Project.name == value, Packages.package_name == value)
+                )
 
-        query2 = session.query(cls).filter(Project.id == Packages.project_id)
+        if distro is not None:
+            query = query.filter(sa.func.lower(Packages.distro_name) == distro.lower())
 
-        if pattern:
-            if "%" in pattern:
-                query2 = query2.filter(Packages.package_name.ilike(pattern))
-            else:
-                query2 = query2.filter(Packages.package_name == pattern)
+        if count:
+            return _count_query(session, query, distinct_column=cls.id)
 
-        if distro is not None:
-            query1 = query1.filter(Project.id == Packages.project_id).filter(
-                sa.func.lower(Packages.distro_name) == sa.func.lower(distro)
-            )
-            query2 = query2.filter(
-                sa.func.lower(Packages.distro_name) == sa.func.lower(distro)
-            )
+        query = _paginate_query(query.distinct(), page, order_col=cls.name)
 
-        query = query1.distinct().union(query2.distinct()).order_by(cls.name)
+        return query.options(*_project_load_options(detailed)).all()
 
-        query = _paginate_query(query, page)
 
-        if count:
-            return query.count()
-        else:
-            return query.all()
+def _project_load_options(detailed=False):
+    """
+    Loader options for queries returning a list of projects.
+
+    The versions are always needed to serialize a project, so they are loaded
+    together with the projects instead of one query per project.
+
+    Args:
+        detailed (bool): Whether to load the packages of the projects as well.
+
+    Returns:
+        list: The loader options to apply to the query.
+    """
+    options = [sa.orm.selectinload(Project.versions_obj)]
+    if detailed:
+        options.append(sa.orm.selectinload(Project.packages))
+    return options
 
 
 class ProjectVersion(Base):
@@ -720,6 +984,21 @@ class ProjectVersion(Base):
         )
         return version.prerelease()
 
+    @classmethod
+    def insert_many(cls, session, entries):
+        """
+        Insert multiple versions using a single executemany ``INSERT``.
+
+        This bypasses the unit of work, so relationships already loaded on
+        the related projects need to be expired by the caller.
+
+        Args:
+            session (sqlalchemy.orm.session.Session): The database session.
+            entries (list): List of dictionaries with column values for each version.
+        """
+        if entries:
+            session.execute(sa.insert(cls), entries)
+
 
 class ProjectFlag(Base):
     """Class ProjectFlag"""
@@ -755,8 +1034,8 @@ class ProjectFlag(Base):
             project=self.project.name,
             user=self.user,
             state=self.state,
-            created_on=time.mktime(self.created_on.timetuple()),
-            updated_on=time.mktime(self.updated_on.timetuple()),
+            created_on=_to_epoch(self.created_on),
+            updated_on=_to_epoch(self.updated_on),
         )
         if detailed:
             output["reason"] = self.reason
@@ -796,33 +1075,33 @@ class ProjectFlag(Base):
             if true, returns the data if false (default).
 
         """
-        query = session.query(cls)
+        stmt = sa.lambda_stmt(lambda: sa.select(cls))
 
         if project_name:
-            query = query.filter(cls.project_id == Project.id).filter(
+            stmt += lambda s: s.where(cls.project_id == Project.id).where(
                 Project.name == project_name
             )
 
         if from_date:
-            query = query.filter(cls.created_on >= from_date)
+            stmt += lambda s: s.where(cls.created_on >= from_date)
 
         if user:
-            query = query.filter(cls.user == user)
+            stmt += lambda s: s.where(cls.user == user)
 
         if state:
-            query = query.filter(cls.state == state)
+            stmt += lambda s: s.where(cls.state == state)
 
-        query = query.order_by(cls.created_on.desc())
+        stmt += lambda s: s.order_by(cls.created_on.desc())
 
         if count:
-            return query.count()
+            return session.execute(_count_stmt(stmt)).scalar()
 
         if offset:
-            query = query.offset(offset)
+            stmt += lambda s: s.offset(offset)
         if limit:
-            query = query.limit(limit)
+            stmt += lambda s: s.limit(limit)
 
-        return query.all()
+        return session.execute(stmt).scalars().all()
 
     @classmethod
     def get(cls, session, flag_id):
@@ -852,73 +1131,63 @@ class Run(Base):
         return query.first()
 
 
-class GUID(TypeDecorator):
+def _uuid7():
     """
-    Platform-independent GUID type.
+    Generate a version 7 UUID, as described in :rfc:`9562`.
+
+    The first 48 bits are the number of milliseconds since the epoch and the
+    rest is random, so UUIDs generated later sort after the earlier ones. Used
+    as primary keys, new rows are appended at the end of the index instead of
+    being spread over all of it.
 
-    If PostgreSQL is being used, use its native UUID type, otherwise use a CHAR(32) type.
+    Returns:
+        uuid.UUID: The new UUID.
     """
+    value = (time.time_ns() // 1_000_000) << 80 | randbits(80)
+    # Version 7 in bits 76 to 79 and the RFC 4122 variant in bits 62 and 63
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
 
-    impl = CHAR
 
-    def load_dialect_impl(self, dialect):
-        """
-        PostgreSQL has a native UUID type, so use it if we're using PostgreSQL.
+class GUID(TypeDecorator):
+    """
+    Platform-independent GUID type.
 
-        Args:
-            dialect (sqlalchemy.engine.interfaces.Dialect): The dialect in use.
+    This is SQLAlchemy's :class:`sqlalchemy.types.Uuid`, which uses the native UUID
+    type of PostgreSQL and a CHAR(32) type with other databases, but also accepts
+    the string representation of UUIDs as bound values.
 
-        Returns:
-            sqlalchemy.types.TypeEngine: Either a PostgreSQL UUID or a CHAR(32) on other
-                dialects.
-        """
-        if dialect.name == "postgresql":
-            return dialect.type_descriptor(UUID())
-        else:
-            return dialect.type_descriptor(CHAR(32))
+    The native type already stores UUIDs in 16 bytes. The CHAR(32) hex strings
+    used by the other databases are kept readable, as they are only used for
+    development and tests, and existing databases rely on this format.
+
+    Results are left to :class:`sqlalchemy.types.Uuid`, so the UUIDs returned by
+    PostgreSQL drivers are used as is instead of being parsed again.
+    """
+
+    impl = sa.Uuid
+    # The processing only depends on the value and the dialect, so statements
+    # using this type can be cached.
+    cache_ok = True
 
     def process_bind_param(self, value, dialect):
         """
         Process the value being bound.
 
-        If PostgreSQL is in use, just use the string representation of the UUID.
-        Otherwise, use the integer as a hex-encoded string.
+        Strings are converted to :class:`uuid.UUID`; the conversion to what the
+        database expects is then done by :class:`sqlalchemy.types.Uuid`.
 
         Args:
             value (object): The value that's being bound to the object.
             dialect (sqlalchemy.engine.interfaces.Dialect): The dialect in use.
 
-        Returns:
-            str: The value of the UUID as a string.
-        """
-        if value is None:
-            return value
-        elif dialect.name == "postgresql":
-            return str(value)
-        else:
-            if not isinstance(value, uuid.UUID):
-                return f"{uuid.UUID(value).int:032x}"
-            else:
-                # hexstring
-                return f"{value.int:032x}"
-
-    def process_result_value(self, value, dialect):
-        """
-        Casts the UUID value to the native Python type.
-
-        Args:
-            value (object): The database value.
-            dialect (sqlalchemy.engine.interfaces.Dialect): The dialect in use.
-
         Returns:
             uuid.UUID: The value as a Python :class:`uuid.UUID`.
         """
-        if value is None:
+        if value is None or isinstance(value, uuid.UUID):
             return value
-        if isinstance(value, uuid.UUID):
-            return value
-        else:
-            return uuid.UUID(value)
+        return uuid.UUID(value)
 
     def process_literal_param(self, value, dialect):
         """Receive a literal parameter value to be rendered inline within
@@ -965,74 +1234,71 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = sa.Column(GUID, primary_key=True, default=uuid.uuid4)
-    # SMTP says 256 is the maximum length of a path:
-    # https://tools.ietf.org/html/rfc5321#section-4.5.3
-    email = sa.Column(sa.String(256), nullable=False, index=True, unique=True)
+    # Generated in Python rather than by the database, as gen_random_uuid() only
+    # returns random UUIDs, which lose the ordering of the version 7 ones.
+    id = sa.Column(GUID, primary_key=True, default=_uuid7)
+    # SMTP says 256 is the maximum length of a path, which includes the angle
+    # brackets around the address: https://tools.ietf.org/html/rfc5321#section-4.5.3
+    email = sa.Column(sa.String(254), nullable=False, index=True, unique=True)
     username = sa.Column(sa.String(256), nullable=False, index=True, unique=True)
     active = sa.Column(sa.Boolean, default=True)
     admin = sa.Column(sa.Boolean, default=False)
 
     @property
-    def is_admin(self):
-        """
-        Determine if this user is an administrator. Set admin flag
-        if the user is preconfigured.
-
-        Returns:
-            bool: True if the user is an administrator.
-        """
-        if not self.admin:
-            if six.text_type(self.id) in anitya_config.get("ANITYA_WEB_ADMINS", []):
-                self.admin = True
-        return self.admin
-
-    @property
-    def is_active(self):
+    def _id_str(self):
         """
-        Implement the flask-login interface for determining if the user is active.
+        The string representation of the user's ID.
 
-        If a user is _not_ active, they are not allowed to log in.
+        It is computed once the ID is set and then kept on the instance, as
+        flask-login asks for it on every request.
 
         Returns:
-            bool: True if the user is active.
+            str: The string of the user's ID.
         """
-        return self.active
+        try:
+            return self.__dict__["_id_str_cache"]
+        except KeyError:
+            if self.id is None:
+                return str(self.id)
+            return self.__dict__.setdefault("_id_str_cache", str(self.id))
 
     @property
-    def is_anonymous(self):
+    def is_admin(self):
         """
-        Implement the flask-login interface for determining if the user is authenticated.
-
-        flask-login uses an "anonymous user" object if there is no authenticated user. This
-        indicates to flask-login this user is not an anonymous user.
+        Determine if this user is an administrator. Set admin flag
+        if the user is preconfigured.
 
         Returns:
-            bool: False in all cases.
+            bool: True if the user is an administrator.
         """
-        return False
+        if not self.admin:
+            if self._id_str in _admin_ids():
+                self.admin = True
+        return self.admin
 
-    @property
-    def is_authenticated(self):
-        """
-        Implement the flask-login interface for determining if the user is authenticated.
+    #: Implement the flask-login interface for determining if the user is active.
+    #: If a user is _not_ active, they are not allowed to log in. This is the
+    #: ``active`` column itself, so it can also be used in queries.
+    is_active = sa.orm.synonym("active")
 
-        In this case, if flask-login has an instance of :class:`User`, then that user has
-        already authenticated via a third-party authentication mechanism.
+    #: Implement the flask-login interface for determining if the user is authenticated.
+    #: flask-login uses an "anonymous user" object if there is no authenticated user.
+    #: This indicates to flask-login this user is not an anonymous user.
+    is_anonymous = False
 
-        Returns:
-            bool: True in all cases.
-        """
-        return True
+    #: Implement the flask-login interface for determining if the user is authenticated.
+    #: In this case, if flask-login has an instance of :class:`User`, then that user has
+    #: already authenticated via a third-party authentication mechanism.
+    is_authenticated = True
 
     def get_id(self):
         """
         Implement the flask-login interface for retrieving the user's ID.
 
         Returns:
-            six.text_type: The Unicode string that uniquely identifies a user.
+            str: The string that uniquely identifies a user.
         """
-        return six.text_type(self.id)
+        return self._id_str
 
     def to_dict(self):
         """
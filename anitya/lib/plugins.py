@@ -35,10 +35,35 @@ class _PluginManager(object):
     def __init__(self, namespace, base_class):
         self._namespace = namespace
         self._base_class = base_class
+        self.cache_clear()
+
+    def cache_clear(self):
+        """Forget the loaded plugins, so they are looked up again on next use."""
+        self._plugins = None
+        self._plugin_names = None
+        self._plugins_by_name = None
+        self._plugins_by_backend = None
+
+    def _load(self):
+        """
+        Load the plugins and index them by name.
+
+        The plugins are only loaded once, as this means walking through the
+        plugin modules. Call :meth:`cache_clear` if the plugins are reloaded.
+        """
+        if self._plugins is None:
+            plugins = list(load(self._namespace, subclasses=self._base_class))
+            plugins_by_name = {}
+            for plugin in plugins:
+                plugins_by_name.setdefault(plugin.name.lower(), plugin)
+            self._plugin_names = frozenset(plugin.name for plugin in plugins)
+            self._plugins_by_name = plugins_by_name
+            self._plugins = plugins
+        return self._plugins
 
     def get_plugins(self):
         """Return the list of plugins."""
-        return load(self._namespace, subclasses=self._base_class)
+        return list(self._load())
 
     def get_plugin_names(self):
         """Return the list of plugin names."""
@@ -46,12 +71,28 @@ class _PluginManager(object):
         output = [plugin.name for plugin in plugins]
         return output
 
+    def has_plugin(self, plugin_name):
+        """Return whether a plugin has exactly the given name."""
+        self._load()
+        return plugin_name in self._plugin_names
+
     def get_plugin(self, plugin_name):
         """Return the plugin corresponding to the given plugin name."""
-        plugins = self.get_plugins()
-        for plugin in plugins:
-            if plugin.name.lower() == plugin_name.lower():
-                return plugin
+        self._load()
+        return self._plugins_by_name.get(plugin_name.lower())
+
+    def get_plugin_by_default_backend(self, backend):
+        """
+        Return the first plugin using the given backend by default.
+
+        Only ecosystem plugins have a default backend.
+        """
+        if self._plugins_by_backend is None:
+            plugins_by_backend = {}
+            for plugin in self._load():
+                plugins_by_backend.setdefault(plugin.default_backend, plugin)
+            self._plugins_by_backend = plugins_by_backend
+        return self._plugins_by_backend.get(backend)
 
 
 BACKEND_PLUGINS = _PluginManager("anitya.lib.backends", BaseBackend)
@@ -118,14 +118,15 @@ def check_project_release(project, session, test=False):
     old_version = project.latest_version or ""
     version_column_len = models.ProjectVersion.version.property.columns[0].type.length
     upstream_versions = []
+    new_versions = []
     for version in versions:
         if version not in p_versions:
             if not version.version:
                 # Skip empty version
                 continue
             if len(version.version) < version_column_len:
-                project.versions_obj.append(
-                    models.ProjectVersion(
+                new_versions.append(
+                    dict(
                         project_id=project.id,
                         version=version.version,
                         commit_url=version.commit_url,
@@ -137,6 +138,10 @@ def check_project_release(project, session, test=False):
                     "Version '%s' was skipped. Reason: too long.", version.version
                 )
 
+    if new_versions:
+        models.ProjectVersion.insert_many(session, new_versions)
+        session.expire(project, ["versions_obj"])
+
     sorted_versions = project.get_sorted_version_objects()
     if sorted_versions:
         max_version_obj = sorted_versions[0]
@@ -215,6 +215,20 @@ class Version(object):
             [self.parse() > v.parse() for v in cast_versions]
         )
 
+    def sort_key(self):
+        """
+        Return the key used to sort versions of this class.
+
+        This is meant to be used as the ``key`` argument of :func:`sorted`.
+        Sub-classes whose ordering can be expressed by a value computed once per
+        version should return that value, which saves calling :meth:`__lt__`
+        for every comparison. By default the version itself is returned.
+
+        Returns:
+            object: An object that sorts in the same order as the versions.
+        """
+        return self
+
     def __lt__(self, other):
         """Support < comparison via objects returned from :meth:`parse`"""
         try:
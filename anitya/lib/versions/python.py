@@ -161,6 +161,20 @@ class PythonVersion(base.Version):
             [self.version_object > v.version_object for v in cast_versions]
         )
 
+    def sort_key(self):
+        """
+        Return the key used to sort versions of this class.
+
+        Validated versions are sorted by their :meth:`version_object` and always
+        sort higher than unvalidated versions, which are sorted as strings.
+
+        Returns:
+            tuple: The key to sort the version by.
+        """
+        if self.version_object:
+            return (True, self.version_object)
+        return (False, self.version)
+
     def __lt__(self, other):
         """Support < comparison via objects returned from :meth:`version_object`"""
         # Handle the cases where one or both can't be validated. Validated versions
@@ -137,3 +137,42 @@ class SetEcosystemHomepageTests(DatabaseTestCase):
         Session.add(project)
         Session.commit()
         self.assertEqual("https://pypi.org/requests", project.ecosystem_name)
+
+
+class ClearLookupCacheTests(DatabaseTestCase):
+    """ClearLookupCacheTests"""
+
+    def test_flush(self):
+        """Assert the remembered lookups are dropped when the session is flushed."""
+        Session.add(models.Distro(name="Fedora"))
+        Session.flush()
+
+        models.Distro.by_name(Session, "fedora")
+        self.assertEqual(1, len(Session.info[models.LOOKUP_CACHE_KEY]))
+
+        Session.add(models.Distro(name="Debian"))
+        Session.flush()
+        self.assertEqual({}, Session.info[models.LOOKUP_CACHE_KEY])
+
+    def test_commit(self):
+        """Assert the remembered lookups are dropped on commit, even with no changes."""
+        Session.add(models.Distro(name="Fedora"))
+        Session.commit()
+
+        models.Distro.by_name(Session, "fedora")
+        self.assertEqual(1, len(Session.info[models.LOOKUP_CACHE_KEY]))
+        self.assertFalse(Session.dirty)
+
+        Session.commit()
+        self.assertEqual({}, Session.info[models.LOOKUP_CACHE_KEY])
+
+    def test_rollback(self):
+        """Assert the remembered lookups are dropped when the session is rolled back."""
+        Session.add(models.Distro(name="Fedora"))
+        Session.flush()
+
+        models.Distro.by_name(Session, "fedora")
+        Session.rollback()
+
+        self.assertEqual({}, Session.info[models.LOOKUP_CACHE_KEY])
+        self.assertIsNone(models.Distro.by_name(Session, "fedora"))
@@ -23,10 +23,10 @@
 anitya tests of the models.
 """
 
+import calendar
 import datetime
-import time
 import unittest
-from uuid import UUID, uuid4
+from uuid import RFC_4122, UUID, uuid4
 
 import anitya_schema
 import arrow
@@ -34,9 +34,9 @@ import mock
 import six
 from fedora_messaging import testing as fml_testing
 from social_flask_sqlalchemy import models as social_models
+from sqlalchemy import UniqueConstraint, create_engine, inspect, select
 from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.types import CHAR
 
 from anitya.db import models
 from anitya.lib import utilities, versions
@@ -107,6 +107,18 @@ class ProjectTests(DatabaseTestCase):
         )
         self.assertEqual("pypi", project.__json__()["ecosystem"])
 
+    def test_timestamps_in_json(self):
+        """Assert the timestamps returned from ``__json__`` are UTC POSIX timestamps"""
+        project = models.Project(
+            name="test",
+            homepage="https://example.com",
+            backend="custom",
+            created_on=datetime.datetime(2020, 1, 2, 3, 4, 5, 678),
+        )
+        output = project.__json__()
+        self.assertEqual(1577934245.0, output["created_on"])
+        self.assertIsNone(output["updated_on"])
+
     def test_create_version_objects_RPM(self):
         """
         Assert that the correct version objects list is returned (RPM version scheme).
@@ -305,6 +317,52 @@ class ProjectTests(DatabaseTestCase):
         self.assertEqual(version_objects[0].version, version_second.version)
         self.assertEqual(version_objects[1].version, version_first.version)
 
+    def test_get_sorted_version_objects_equal(self):
+        """Assert that equal versions are returned from the last one stored."""
+        project = models.Project(
+            name="test",
+            homepage="https://example.com",
+            backend="custom",
+            ecosystem_name="pypi",
+            version_scheme="Semantic",
+        )
+        self.session.add(project)
+        self.session.commit()
+
+        self.session.add(
+            models.ProjectVersion(project_id=project.id, version="1.0.0+build.1")
+        )
+        self.session.add(
+            models.ProjectVersion(project_id=project.id, version="1.0.0+build.2")
+        )
+        self.session.commit()
+
+        version_objects = project.get_sorted_version_objects()
+
+        self.assertEqual(
+            [version.version for version in version_objects],
+            ["1.0.0+build.2", "1.0.0+build.1"],
+        )
+
+    def test_get_sorted_version_objects_no_versions(self):
+        """Assert that the version class isn't looked up when there is no version."""
+        project = models.Project(
+            name="test",
+            homepage="https://example.com",
+            backend="custom",
+            ecosystem_name="pypi",
+            version_scheme="RPM",
+        )
+        self.session.add(project)
+        self.session.commit()
+
+        with mock.patch.object(project, "get_version_class") as mock_version_class:
+            self.assertEqual(project.get_sorted_version_objects(), [])
+            self.assertEqual(project.versions, [])
+            self.assertEqual(project.__json__()["versions"], [])
+
+        mock_version_class.assert_not_called()
+
     def test_latest_version_object_with_versions(self):
         """Test the latest_version_object property with versions."""
         project = models.Project(
@@ -376,6 +434,46 @@ class ProjectTests(DatabaseTestCase):
         projects = models.Project.all(self.session, page="asd")
         self.assertEqual(len(projects), 3)
 
+    def test_project_all_count_statement(self):
+        """Assert the projects are counted without a subquery."""
+        create_project(self.session)
+
+        with mock.patch.object(
+            self.session, "execute", wraps=self.session.execute
+        ) as mock_execute:
+            self.assertEqual(models.Project.all(self.session, count=True), 3)
+
+        statement = str(mock_execute.call_args[0][0])
+        self.assertEqual(statement.count("SELECT"), 1)
+        self.assertIn("count(*)", statement)
+
+    def test_project_all_eager_load(self):
+        """Assert the relationships needed for serialization are loaded with projects."""
+        create_project(self.session)
+        create_package(self.session)
+        self.session.expire_all()
+
+        projects = models.Project.all(self.session)
+        for project in projects:
+            self.assertNotIn("versions_obj", inspect(project).unloaded)
+            self.assertIn("packages", inspect(project).unloaded)
+
+        projects = models.Project.all(self.session, detailed=True)
+        for project in projects:
+            self.assertNotIn("versions_obj", inspect(project).unloaded)
+            self.assertNotIn("packages", inspect(project).unloaded)
+
+    def test_project_search_eager_load(self):
+        """Assert the versions are loaded together with the found projects."""
+        create_project(self.session)
+        create_package(self.session)
+        self.session.expire_all()
+
+        projects = models.Project.search(self.session, "*")
+        self.assertEqual(len(projects), 3)
+        for project in projects:
+            self.assertNotIn("versions_obj", inspect(project).unloaded)
+
     def test_project_search(self):
         """Test the Project.search function."""
         create_project(self.session)
@@ -390,6 +488,50 @@ class ProjectTests(DatabaseTestCase):
         projects = models.Project.search(self.session, "*", page="asd")
         self.assertEqual(len(projects), 3)
 
+    def test_project_search_package_name(self):
+        """
+        Assert that projects are found by their name or the name of their packages
+        and are returned only once.
+        """
+        create_distro(self.session)
+        create_project(self.session)
+        create_package(self.session)
+        package = models.Packages(
+            distro_name="Debian", project_id=1, package_name="geany-debian"
+        )
+        self.session.add(package)
+        package = models.Packages(
+            distro_name="Debian", project_id=3, package_name="python-r2spec"
+        )
+        self.session.add(package)
+        self.session.commit()
+
+        projects = models.Project.search(self.session, "geany*")
+        self.assertEqual([project.name for project in projects], ["geany"])
+
+        projects = models.Project.search(self.session, "python-r2spec")
+        self.assertEqual([project.name for project in projects], ["R2spec"])
+
+        projects = models.Project.search(self.session, "*e*", count=True)
+        self.assertEqual(projects, 3)
+
+        projects = models.Project.search(self.session, "*e*", distro="Debian")
+        self.assertEqual([project.name for project in projects], ["R2spec", "geany"])
+
+    def test_project_search_underscore(self):
+        """Assert that an underscore only matches itself in the search pattern."""
+        project = models.Project(name="foo_bar", homepage="https://example.com/1")
+        self.session.add(project)
+        project = models.Project(name="fooxbar", homepage="https://example.com/2")
+        self.session.add(project)
+        self.session.commit()
+
+        projects = models.Project.search(self.session, "foo_bar")
+        self.assertEqual([project.name for project in projects], ["foo_bar"])
+
+        projects = models.Project.search(self.session, "foo_*")
+        self.assertEqual([project.name for project in projects], ["foo_bar"])
+
     def test_project_search_no_pattern(self):
         """
         Assert that all projects are returned when
@@ -400,6 +542,31 @@ class ProjectTests(DatabaseTestCase):
         projects = models.Project.search(self.session, "")
         self.assertEqual(len(projects), 3)
 
+    def test_project_by_distro(self):
+        """
+        Assert that projects mapped to the distro are returned once, even with
+        multiple packages in it.
+        """
+        create_distro(self.session)
+        create_project(self.session)
+        create_package(self.session)
+        package = models.Packages(
+            distro_name="Fedora", project_id=1, package_name="geany-plugins"
+        )
+        self.session.add(package)
+        self.session.commit()
+
+        projects = models.Project.by_distro(self.session, "fedora")
+        self.assertEqual(
+            [project.name for project in projects], ["geany", "subsurface"]
+        )
+
+        count = models.Project.by_distro(self.session, "fedora", count=True)
+        self.assertEqual(count, 2)
+
+        projects = models.Project.by_distro(self.session, "Debian")
+        self.assertEqual(projects, [])
+
     def test_project_search_by_distro(self):
         """
         Assert that only projects with mappings to specific distro
@@ -629,6 +796,16 @@ class ProjectTests(DatabaseTestCase):
         self.assertEqual(len(projects), 1)
         self.assertEqual(projects[0].name, "geany")
 
+    def test_project_updated_eager_load(self):
+        """Assert the versions are loaded together with the updated projects."""
+        create_project(self.session)
+        self.session.expire_all()
+
+        projects = models.Project.updated(self.session, status="never_updated")
+        self.assertEqual(len(projects), 3)
+        for project in projects:
+            self.assertNotIn("versions_obj", inspect(project).unloaded)
+
     def test_project_updated_count(self):
         """
         Assert that correct count is returned.
@@ -643,6 +820,77 @@ class ProjectTests(DatabaseTestCase):
         projects = models.Project.updated(self.session, count=True)
         self.assertEqual(projects, 1)
 
+    def test_project_updated_statement_cache(self):
+        """
+        Assert that the statement is compiled once for different names.
+        """
+        create_project(self.session)
+        cache = self.connection.engine._compiled_cache  # pylint: disable=W0212
+
+        projects = models.Project.updated(self.session, status="all", name="geany")
+        self.assertEqual([project.name for project in projects], ["geany"])
+        cache_size = len(cache)
+
+        projects = models.Project.updated(self.session, status="all", name="subsurface")
+        self.assertEqual([project.name for project in projects], ["subsurface"])
+        self.assertEqual(cache_size, len(cache))
+
+    def test_project_updated_underscore(self):
+        """
+        Assert that an underscore only matches itself in the name and log patterns.
+        """
+        project = models.Project(
+            name="foo_bar", homepage="https://example.com/1", logs="no_version"
+        )
+        self.session.add(project)
+        project = models.Project(
+            name="fooxbar", homepage="https://example.com/2", logs="noxversion"
+        )
+        self.session.add(project)
+        self.session.commit()
+
+        projects = models.Project.updated(self.session, status="all", name="o_b")
+        self.assertEqual([project.name for project in projects], ["foo_bar"])
+
+        projects = models.Project.updated(self.session, status="all", name="foo_*")
+        self.assertEqual([project.name for project in projects], ["foo_bar"])
+
+        projects = models.Project.updated(self.session, status="all", log="o_v")
+        self.assertEqual([project.name for project in projects], ["foo_bar"])
+
+
+class CompilePatternTests(unittest.TestCase):
+    """Tests for the :func:`anitya.db.models._compile_pattern` function."""
+
+    def test_exact(self):
+        """Assert a pattern without wildcard is compared for equality."""
+        self.assertEqual(models._compile_pattern("foo_bar"), ("==", "foo_bar"))
+
+    def test_wildcard(self):
+        """Assert wildcards are turned into an escaped ILIKE pattern."""
+        self.assertEqual(models._compile_pattern("foo_*"), ("ilike", r"foo\_%"))
+        self.assertEqual(models._compile_pattern("foo%"), ("ilike", "foo%"))
+
+    def test_contains(self):
+        """Assert the pattern is wrapped in wildcards when looking for a part."""
+        self.assertEqual(
+            models._compile_pattern("foo_bar", contains=True), ("ilike", r"%foo\_bar%")
+        )
+        self.assertEqual(
+            models._compile_pattern("foo*", contains=True), ("ilike", "foo%")
+        )
+
+
+class PaginateQueryTests(unittest.TestCase):
+    """Tests for the :func:`anitya.db.models._paginate_query` function."""
+
+    def test_after_without_order_col(self):
+        """Assert keyset pagination needs a column to order by."""
+        query = mock.Mock()
+
+        self.assertRaises(ValueError, models._paginate_query, query, None, after="a")
+        query.filter.assert_not_called()
+
 
 class DistroTestCase(DatabaseTestCase):
     """Tests for Distro model."""
@@ -656,6 +904,23 @@ class DistroTestCase(DatabaseTestCase):
         self.assertEqual(distros[0].name, "Debian")
         self.assertEqual(distros[1].name, "Fedora")
 
+    def test_distro_all_after(self):
+        """Assert that `Distro.all` returns the distros following the given name."""
+        create_distro(self.session)
+
+        distros = models.Distro.all(self.session, after="Debian")
+        self.assertEqual([distro.name for distro in distros], ["Fedora"])
+
+        distros = models.Distro.all(self.session, page=2, after="Fedora")
+        self.assertEqual(distros, [])
+
+    def test_distro_search_after(self):
+        """Assert that `Distro.search` returns the distros following the given name."""
+        create_distro(self.session)
+
+        distros = models.Distro.search(self.session, "*", after="Debian")
+        self.assertEqual([distro.name for distro in distros], ["Fedora"])
+
     def test_distro_delete_cascade(self):
         """Assert deletion of mapped packages when project is deleted"""
         project = models.Project(
@@ -697,6 +962,25 @@ class DistroTestCase(DatabaseTestCase):
         logs = models.Distro.search(self.session, "*", count=True)
         self.assertEqual(logs, 2)
 
+    def test_distro_by_name_cached(self):
+        """Assert that `Distro.by_name` only queries the database once per name."""
+        create_distro(self.session)
+
+        distro = models.Distro.by_name(self.session, "fedora")
+        with mock.patch.object(self.session, "query") as mock_query:
+            self.assertIs(distro, models.Distro.by_name(self.session, "FEDORA"))
+        mock_query.assert_not_called()
+
+    def test_distro_by_name_cached_deleted(self):
+        """Assert that `Distro.by_name` doesn't return a distro pending deletion."""
+        create_distro(self.session)
+
+        distro = models.Distro.by_name(self.session, "fedora")
+        self.session.delete(distro)
+        self.session.flush()
+
+        self.assertIsNone(models.Distro.by_name(self.session, "fedora"))
+
     def test_distro_search_pattern(self):
         """
         Assert that `Distro.search` returns correct distribution,
@@ -755,6 +1039,38 @@ class ProjectVersion(DatabaseTestCase):
 
         self.assertTrue(version.pre_release)
 
+    def test_insert_many(self):
+        """Test that multiple versions are inserted at once."""
+        project = models.Project(
+            name="test",
+            homepage="https://example.com",
+            backend="custom",
+            ecosystem_name="pypi",
+        )
+        self.session.add(project)
+        self.session.flush()
+
+        models.ProjectVersion.insert_many(
+            self.session,
+            [
+                {"project_id": project.id, "version": "1.0.0"},
+                {"project_id": project.id, "version": "1.0.1"},
+            ],
+        )
+        self.session.expire(project, ["versions_obj"])
+
+        self.assertEqual(
+            sorted(version.version for version in project.versions_obj),
+            ["1.0.0", "1.0.1"],
+        )
+        self.assertIsNotNone(project.versions_obj[0].created_on)
+
+    def test_insert_many_empty(self):
+        """Test that nothing is executed when there are no versions."""
+        session = mock.Mock()
+        models.ProjectVersion.insert_many(session, [])
+        session.execute.assert_not_called()
+
 
 class PackageTestCase(DatabaseTestCase):
     """Tests for Package model."""
@@ -778,6 +1094,29 @@ class PackageTestCase(DatabaseTestCase):
         pkg = models.Packages.by_id(self.session, 1)
         self.assertEqual(str(pkg), "<Packages(1, Fedora: geany)>")
 
+    def test_packages_get_cached(self):
+        """Test that Packages.get only queries the database once per package."""
+        create_project(self.session)
+        create_distro(self.session)
+        create_package(self.session)
+
+        pkg = models.Packages.get(self.session, 1, "fedora", "geany")
+        with mock.patch.object(self.session, "query") as mock_query:
+            self.assertIs(pkg, models.Packages.get(self.session, 1, "Fedora", "geany"))
+        mock_query.assert_not_called()
+
+    def test_packages_get_cached_modified(self):
+        """Test that Packages.get doesn't return a package with pending changes."""
+        create_project(self.session)
+        create_distro(self.session)
+        create_package(self.session)
+
+        pkg = models.Packages.get(self.session, 1, "Fedora", "geany")
+        pkg.package_name = "geany2"
+        self.session.flush()
+
+        self.assertIsNone(models.Packages.get(self.session, 1, "Fedora", "geany"))
+
 
 class ProjectFlagTestCase(DatabaseTestCase):
     """Tests for ProjectFlag model."""
@@ -792,11 +1131,11 @@ class ProjectFlagTestCase(DatabaseTestCase):
         """Test the ProjectFlag.__json__ function."""
         flag = create_flagged_project(self.session)
         data = {
-            "created_on": time.mktime(flag.created_on.timetuple()),
+            "created_on": calendar.timegm(flag.created_on.utctimetuple()),
             "user": "dgay@redhat.com",
             "state": "open",
             "project": "geany",
-            "updated_on": time.mktime(flag.updated_on.timetuple()),
+            "updated_on": calendar.timegm(flag.updated_on.utctimetuple()),
             "id": 1,
         }
 
@@ -812,6 +1151,27 @@ class ProjectFlagTestCase(DatabaseTestCase):
         flags = models.ProjectFlag.all(self.session)
         self.assertEqual(len(flags), 1)
 
+    def test_project_flag_search_statement_cache(self):
+        """
+        Assert that 'ProjectFlag.search' statement is compiled once for different users.
+        """
+        flag = create_flagged_project(self.session)
+        self.session.add(
+            models.ProjectFlag(
+                project=flag.project, reason="Not a project.", user="cthulhu@redhat.com"
+            )
+        )
+        self.session.commit()
+        cache = self.connection.engine._compiled_cache  # pylint: disable=W0212
+
+        flags = models.ProjectFlag.search(self.session, user="dgay@redhat.com")
+        self.assertEqual([flag.user for flag in flags], ["dgay@redhat.com"])
+        cache_size = len(cache)
+
+        flags = models.ProjectFlag.search(self.session, user="cthulhu@redhat.com")
+        self.assertEqual([flag.user for flag in flags], ["cthulhu@redhat.com"])
+        self.assertEqual(cache_size, len(cache))
+
     def test_project_flag_search_by_name(self):
         """
         Assert that 'ProjectFlag.search' returns correct project
@@ -953,61 +1313,103 @@ class ProjectFlagTestCase(DatabaseTestCase):
         self.assertEqual(flags, 2)
 
 
+class Uuid7Tests(unittest.TestCase):
+    """Tests for the :func:`anitya.db.models._uuid7` function."""
+
+    def test_version(self):
+        """Assert a version 7 UUID of the RFC 4122 variant is returned."""
+        result = models._uuid7()  # pylint: disable=W0212
+
+        self.assertEqual(7, result.version)
+        self.assertEqual(RFC_4122, result.variant)
+
+    @mock.patch("anitya.db.models.time.time_ns")
+    def test_timestamp(self, mock_time_ns):
+        """Assert the first 48 bits are the time in milliseconds."""
+        mock_time_ns.return_value = 1_700_000_000_123_456_789
+
+        result = models._uuid7()  # pylint: disable=W0212
+
+        self.assertEqual(1_700_000_000_123, result.int >> 80)
+
+    @mock.patch("anitya.db.models.time.time_ns")
+    def test_ordering(self, mock_time_ns):
+        """Assert UUIDs generated later sort after the earlier ones."""
+        mock_time_ns.side_effect = [1_000_000_000, 2_000_000_000]
+
+        first = models._uuid7()  # pylint: disable=W0212
+        second = models._uuid7()  # pylint: disable=W0212
+
+        self.assertLess(first, second)
+
+
 class GuidTests(unittest.TestCase):
     """Tests for the :class:`anitya.db.models.GUID` class."""
 
-    def test_load_dialect_impl_postgres(self):
+    def test_cache_key(self):
+        """Assert statements using GUID columns can be cached."""
+        first = select(models.User).where(models.User.id == uuid4())
+        second = select(models.User).where(models.User.id == uuid4())
+
+        first_key = first._generate_cache_key()  # pylint: disable=W0212
+        second_key = second._generate_cache_key()  # pylint: disable=W0212
+
+        self.assertIsNotNone(first_key)
+        self.assertEqual(first_key, second_key)
+
+    def test_statement_cache(self):
+        """Assert queries on GUID columns hit the compiled statement cache."""
+        engine = create_engine("sqlite://")
+        models.User.__table__.create(engine)
+        self.assertTrue(engine.dialect.supports_statement_cache)
+
+        with engine.connect() as connection:
+            for __ in range(2):
+                result = connection.execute(
+                    select(models.User).where(models.User.id == uuid4())
+                )
+
+        self.assertEqual(engine.dialect.CACHE_HIT, result.context.cache_hit)
+
+    def test_compile_postgres(self):
         """Assert with PostgreSQL, a UUID type is used."""
         guid = models.GUID()
         dialect = postgresql.dialect()
 
-        result = guid.load_dialect_impl(dialect)
+        result = guid.compile(dialect=dialect)
 
-        self.assertTrue(isinstance(result, postgresql.UUID))
+        self.assertEqual("UUID", result)
 
-    def test_load_dialect_impl_other(self):
+    def test_compile_other(self):
         """Assert with dialects other than PostgreSQL, a CHAR type is used."""
         guid = models.GUID()
         dialect = sqlite.dialect()
 
-        result = guid.load_dialect_impl(dialect)
+        result = guid.compile(dialect=dialect)
 
-        self.assertTrue(isinstance(result, CHAR))
+        self.assertEqual("CHAR(32)", result)
 
-    def test_process_bind_param_uuid_postgres(self):
-        """Assert UUIDs with PostgreSQL are normal string representations of UUIDs."""
+    def test_process_bind_param_uuid(self):
+        """Assert UUIDs are returned as they are."""
         guid = models.GUID()
         uuid = uuid4()
-        dialect = postgresql.dialect()
 
-        result = guid.process_bind_param(uuid, dialect)
+        result = guid.process_bind_param(uuid, postgresql.dialect())
 
-        self.assertEqual(str(uuid), result)
+        self.assertIs(uuid, result)
 
-    def test_process_bind_param_uuid_other(self):
-        """Assert UUIDs with other dialects are hex-encoded strings of length 32."""
+    def test_process_bind_param_str(self):
+        """Assert strings are converted to UUIDs."""
         guid = models.GUID()
         uuid = uuid4()
-        dialect = sqlite.dialect()
 
-        result = guid.process_bind_param(uuid, dialect)
+        result = guid.process_bind_param(str(uuid), sqlite.dialect())
 
-        self.assertEqual(32, len(result))
-        self.assertEqual(str(uuid).replace("-", ""), result)
-
-    def test_process_bind_param_str_other(self):
-        """Assert UUIDs with other dialects are hex-encoded strings of length 32."""
-        guid = models.GUID()
-        uuid = uuid4()
-        dialect = sqlite.dialect()
-
-        result = guid.process_bind_param(str(uuid), dialect)
-
-        self.assertEqual(32, len(result))
-        self.assertEqual(str(uuid).replace("-", ""), result)
+        self.assertTrue(isinstance(result, UUID))
+        self.assertEqual(uuid, result)
 
     def test_process_bind_param_none(self):
-        """Assert UUIDs with other dialects are hex-encoded strings of length 32."""
+        """Assert None is returned as it is."""
         guid = models.GUID()
         dialect = sqlite.dialect()
 
@@ -1015,38 +1417,53 @@ class GuidTests(unittest.TestCase):
 
         self.assertTrue(result is None)
 
-    def test_process_result_value_none(self):
-        """Assert when the result value is None, None is returned."""
-        guid = models.GUID()
+    def test_bind_processor_postgres(self):
+        """Assert with PostgreSQL, UUIDs are passed to the driver as they are."""
+        dialect = postgresql.dialect()
+        process = models.GUID().dialect_impl(dialect).bind_processor(dialect)
+        uuid = uuid4()
 
-        self.assertTrue(guid.process_result_value(None, sqlite.dialect()) is None)
+        self.assertIs(uuid, process(uuid))
+        self.assertEqual(uuid, process(str(uuid)))
+        self.assertIsNone(process(None))
 
-    def test_process_result_string(self):
-        """Assert when the result value is a string, a native UUID is returned."""
-        guid = models.GUID()
+    def test_bind_processor_other(self):
+        """Assert with other dialects, UUIDs are hex-encoded strings of length 32."""
+        dialect = sqlite.dialect()
+        process = models.GUID().dialect_impl(dialect).bind_processor(dialect)
         uuid = uuid4()
 
-        result = guid.process_result_value(str(uuid), sqlite.dialect())
+        self.assertEqual(str(uuid).replace("-", ""), process(uuid))
+        self.assertEqual(str(uuid).replace("-", ""), process(str(uuid)))
+        self.assertIsNone(process(None))
 
-        self.assertTrue(isinstance(result, UUID))
-        self.assertEqual(uuid, result)
+    def test_result_processor_postgres(self):
+        """Assert with PostgreSQL, the UUIDs returned by the driver are used as is."""
+        dialect = postgresql.dialect()
+        guid = models.GUID().dialect_impl(dialect)
 
-    def test_process_result_short_string(self):
-        """Assert when the result value is a short string, a native UUID is returned."""
-        guid = models.GUID()
-        uuid = uuid4()
+        self.assertIsNone(guid.result_processor(dialect, None))
 
-        result = guid.process_result_value(str(uuid).replace("-", ""), sqlite.dialect())
+    def test_result_processor_postgres_decorator(self):
+        """Assert with PostgreSQL, GUID itself adds no processing of the results."""
+        dialect = postgresql.dialect()
 
-        self.assertTrue(isinstance(result, UUID))
-        self.assertEqual(uuid, result)
+        self.assertIsNone(models.GUID().result_processor(dialect, None))
 
-    def test_process_result_uuid(self):
-        """Assert when the result value is a UUID it is returned."""
-        guid = models.GUID()
+    def test_result_processor_none(self):
+        """Assert when the result value is None, None is returned."""
+        dialect = sqlite.dialect()
+        process = models.GUID().dialect_impl(dialect).result_processor(dialect, None)
+
+        self.assertTrue(process(None) is None)
+
+    def test_result_processor_short_string(self):
+        """Assert when the result value is a short string, a native UUID is returned."""
+        dialect = sqlite.dialect()
+        process = models.GUID().dialect_impl(dialect).result_processor(dialect, None)
         uuid = uuid4()
 
-        result = guid.process_result_value(uuid, sqlite.dialect())
+        result = process(str(uuid).replace("-", ""))
 
         self.assertTrue(isinstance(result, UUID))
         self.assertEqual(uuid, result)
@@ -1077,6 +1494,44 @@ class UserTests(DatabaseTestCase):
 
         self.assertEqual(six.text_type(user.id), user.get_id())
 
+    def test_user_get_id_cached(self):
+        """Assert the user ID string is only computed once the ID is set."""
+        user = models.User(email="user@fedoraproject.org", username="user")
+        self.assertEqual("None", user.get_id())
+
+        self.session.add(user)
+        self.session.commit()
+        user_id = user.get_id()
+
+        self.assertEqual(six.text_type(user.id), user_id)
+        self.session.expire(user)
+        with mock.patch.object(self.session, "execute") as mock_execute:
+            self.assertIs(user_id, user.get_id())
+        mock_execute.assert_not_called()
+
+    def test_user_single_index(self):
+        """Assert the unique email and username columns only get one index each."""
+        indexes = sorted(
+            (index.name, [column.name for column in index.columns], index.unique)
+            for index in models.User.__table__.indexes
+        )
+
+        self.assertEqual(
+            indexes,
+            [
+                ("ix_users_email", ["email"], True),
+                ("ix_users_username", ["username"], True),
+            ],
+        )
+        self.assertEqual(
+            [],
+            [
+                constraint
+                for constraint in models.User.__table__.constraints
+                if isinstance(constraint, UniqueConstraint)
+            ],
+        )
+
     def test_user_email_unique(self):
         """Assert User emails have a uniqueness constraint on them."""
         user = models.User(email="user@fedoraproject.org", username="user")
@@ -1119,6 +1574,17 @@ class UserTests(DatabaseTestCase):
         self.assertTrue(user.active)
         self.assertTrue(user.is_active)
 
+    def test_is_active_query(self):
+        """Assert User.is_active can be used to filter users."""
+        self.session.add(models.User(email="user@fedoraproject.org", username="user"))
+        self.session.add(
+            models.User(email="old@fedoraproject.org", username="old", active=False)
+        )
+        self.session.commit()
+
+        users = self.session.query(models.User).filter(models.User.is_active.is_(True))
+        self.assertEqual(["user"], [user.username for user in users])
+
     def test_not_anonymous(self):
         """Assert User implements the Flask-Login API for authenticated users."""
         user = models.User(email="user@fedoraproject.org", username="user")
@@ -1160,6 +1626,16 @@ class UserTests(DatabaseTestCase):
             self.assertTrue(user.is_admin)
             self.assertTrue(user.admin)
 
+    def test_admin_ids(self):
+        """Assert the set of administrators follows the configuration."""
+        with mock.patch.dict("anitya.config.config", {"ANITYA_WEB_ADMINS": ["a"]}):
+            admin_ids = models._admin_ids()
+            self.assertEqual(frozenset(["a"]), admin_ids)
+            self.assertIs(admin_ids, models._admin_ids())
+
+        with mock.patch.dict("anitya.config.config", {"ANITYA_WEB_ADMINS": ["b"]}):
+            self.assertEqual(frozenset(["b"]), models._admin_ids())
+
     def test_to_dict(self):
         """Assert the correct dictionary is returned."""
         user = models.User(email="user@fedoraproject.org", username="user")
@@ -25,7 +25,13 @@ anitya tests of the plugins.
 
 import unittest
 
+import mock
+
 from anitya.lib import plugins
+from anitya.lib.backends import pypi
+from anitya.lib.ecosystems import BaseEcosystem
+from anitya.lib.ecosystems import npm as npm_ecosystem
+from anitya.lib.ecosystems import pypi as pypi_ecosystem
 from anitya.lib.versions import Version
 from anitya.tests.base import DatabaseTestCase
 
@@ -124,6 +130,49 @@ class Pluginstests(DatabaseTestCase):
         plugin = plugins.get_plugin("PyPI")
         self.assertEqual(str(plugin), "<class 'anitya.lib.backends.pypi.PypiBackend'>")
 
+    @mock.patch("anitya.lib.plugins.load")
+    def test_plugins_cached(self, mock_load):
+        """Assert the plugins are only loaded once until the cache is cleared."""
+        plugins.BACKEND_PLUGINS.cache_clear()
+        self.addCleanup(plugins.BACKEND_PLUGINS.cache_clear)
+        mock_load.return_value = [pypi.PypiBackend]
+
+        self.assertEqual(plugins.get_plugin("PyPI"), pypi.PypiBackend)
+        self.assertEqual(plugins.get_plugin("pypi"), pypi.PypiBackend)
+        self.assertEqual(plugins.get_plugin_names(), ["PyPI"])
+        self.assertEqual(plugins.get_plugins(), [pypi.PypiBackend])
+        self.assertEqual(mock_load.call_count, 1)
+
+        plugins.BACKEND_PLUGINS.cache_clear()
+        plugins.get_plugins()
+        self.assertEqual(mock_load.call_count, 2)
+
+    @mock.patch("anitya.lib.plugins.load")
+    def test_plugins_cache_clear(self, mock_load):
+        """Assert clearing the cache invalidates the names and backend lookups."""
+        manager = plugins._PluginManager(  # pylint: disable=W0212
+            "anitya.lib.ecosystems", BaseEcosystem
+        )
+        mock_load.return_value = [pypi_ecosystem.PypiEcosystem]
+
+        self.assertTrue(manager.has_plugin("pypi"))
+        self.assertEqual(
+            manager.get_plugin_by_default_backend("PyPI"),
+            pypi_ecosystem.PypiEcosystem,
+        )
+
+        mock_load.return_value = [npm_ecosystem.NpmEcosystem]
+        self.assertTrue(manager.has_plugin("pypi"))
+
+        manager.cache_clear()
+        self.assertFalse(manager.has_plugin("pypi"))
+        self.assertTrue(manager.has_plugin("npm"))
+        self.assertIsNone(manager.get_plugin_by_default_backend("PyPI"))
+        self.assertEqual(
+            manager.get_plugin_by_default_backend("npmjs"),
+            npm_ecosystem.NpmEcosystem,
+        )
+
 
 if __name__ == "__main__":
     SUITE = unittest.TestLoader().loadTestsFromTestCase(Pluginstests)
@@ -191,6 +191,11 @@ class VersionTests(unittest.TestCase):
         self.assertTrue(old_version < new_version)
         self.assertFalse(new_version < old_version)
 
+    def test_sort_key(self):
+        """Assert the version itself is used as sort key by default."""
+        version = base.Version(version="v1.0.0")
+        self.assertIs(version, version.sort_key())
+
     def test_lt_one_unparsable(self):
         """Assert unparsable versions sort lower than parsable ones."""
         unparsable_version = base.Version(version="blarg")
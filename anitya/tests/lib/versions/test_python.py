@@ -199,6 +199,24 @@ class PythonVersionTests(unittest.TestCase):
         self.assertLess(old_version, new_version)
         self.assertGreaterEqual(new_version, old_version)
 
+    def test_sort_key(self):
+        """Assert the sort key orders versions like < comparison."""
+        versions = [
+            python.PythonVersion(version="1.1.0"),
+            python.PythonVersion(version="1.0.0junk"),
+            python.PythonVersion(version="1.0.0"),
+            python.PythonVersion(version="1.1.0rc1"),
+            python.PythonVersion(version="0.9.0junk"),
+        ]
+        self.assertEqual(
+            ["0.9.0junk", "1.0.0junk", "1.0.0", "1.1.0rc1", "1.1.0"],
+            [v.version for v in sorted(versions, key=python.PythonVersion.sort_key)],
+        )
+        self.assertEqual(
+            [v.version for v in sorted(versions)],
+            [v.version for v in sorted(versions, key=python.PythonVersion.sort_key)],
+        )
+
     def test_le(self):
         """Assert PythonVersion supports <= comparison."""
         old_version = python.PythonVersion(version="1.0.0")
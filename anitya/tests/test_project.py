@@ -95,6 +95,19 @@ class Projecttests(DatabaseTestCase):
         project = models.Project.by_homepage(self.session, "terminal")
         self.assertEqual(project, [])
 
+    def test_project_by_homepage_iter(self):
+        """Test the by_homepage_iter function of Project."""
+        create_project(self.session)
+
+        projects = list(
+            models.Project.by_homepage_iter(self.session, "https://www.geany.org/")
+        )
+        self.assertEqual(len(projects), 1)
+        self.assertEqual(projects[0].name, "geany")
+
+        projects = list(models.Project.by_homepage_iter(self.session, "terminal"))
+        self.assertEqual(projects, [])
+
     def test_project_all(self):
         """Test the all function of Project."""
         create_project(self.session)